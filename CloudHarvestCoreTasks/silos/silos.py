@@ -82,6 +82,28 @@ class BaseSilo:
         """
         raise NotImplementedError
 
+    def client_configuration(self, **defaults) -> dict:
+        """
+        Returns the supported client parameters for this Silo. Each parameter is read once from the extended database
+        configuration, then the Silo's attributes, then the provided defaults.
+
+        :param defaults: Default values for client parameters which are not otherwise configured.
+        """
+
+        config = {}
+
+        for key in self.SUPPORTED_CLIENT_PARAMETERS:
+            if key in self.extended_db_configuration:
+                config[key] = self.extended_db_configuration[key]
+
+            elif hasattr(self, key):
+                config[key] = getattr(self, key)
+
+            elif key in defaults:
+                config[key] = defaults[key]
+
+        return config
+
     def call_with_supported_client_parameters(self, func, **kwargs):
         """
         Calls a function with only the supported client parameters.
@@ -172,26 +194,20 @@ class MongoSilo(BaseSilo):
             MongoClient: A MongoClient instance connected to the specified database.
         """
 
-        # Already connected
-        if self.is_connected:
+        # Already connected; MongoClient manages reconnection within its pool, so the server is not pinged here
+        if self.pool is not None:
             return self.pool
 
-        # Prepare the configuration
-        default_configuration = {
-            'maxPoolSize': 50,
-        }
-
-        config = default_configuration | self.__dict__() | self.extended_db_configuration
-
         # Create the client object
         from pymongo import MongoClient
-        self.pool: MongoClient = self.call_with_supported_client_parameters(MongoClient, **config)
+        self.pool: MongoClient = MongoClient(**self.client_configuration(maxPoolSize=50))
 
         # Test that the connection works
         if self.is_connected:
             return self.pool
 
         else:
+            self.pool = None
             raise ConnectionError(f'Could not connect to the MongoDB database {self.name}.')
 
 @register_definition('silo', 'redis_silo')
@@ -234,21 +250,15 @@ class RedisSilo(BaseSilo):
         """
 
         # Check if a connection pool already exists for the specified database
-        if self.is_connected:
+        if self.pool is not None:
             from redis import StrictRedis
             return StrictRedis(connection_pool=self.pool)
 
         # Create a new connection pool for the specified database
-        default_configuration = {
-            'db': self.database,
-            'max_connections': 50,
-            'decode_responses': True
-        }
-
-        config = default_configuration | self.__dict__()
-
         from redis import ConnectionPool
-        self.pool: ConnectionPool = self.call_with_supported_client_parameters(ConnectionPool, **config)
+        self.pool: ConnectionPool = ConnectionPool(**self.client_configuration(db=self.database,
+                                                                              max_connections=50,
+                                                                              decode_responses=True))
 
         from redis import StrictRedis
         connection = StrictRedis(connection_pool=self.pool)
@@ -21,27 +21,126 @@ Modules:
 """
 
 from CloudHarvestCorePluginManager.decorators import register_definition
+from collections import deque, OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime, timezone
 from enum import Enum
-from threading import Thread
+from functools import cached_property, lru_cache
+from itertools import islice
+from hashlib import sha256
+from json import dumps
+from threading import Condition, Event, Lock, Thread
+from types import MappingProxyType
 from typing import Any, Dict, List, Literal
-from logging import getLogger
+from logging import getLogger, CRITICAL, DEBUG, ERROR, INFO, WARNING
+from random import uniform
+from re import compile as re_compile, IGNORECASE
+from sys import getsizeof
+from time import monotonic, sleep
+from types import GeneratorType
+from uuid import uuid4
 
-from silos import get_silo
+from ..silos import get_silo
+from .templating import get_environment
 
 _log_levels = Literal['debug', 'info', 'warning', 'error', 'critical']
-USER_FILTERS = {
-    'add_keys': [],
+_LOG_LEVEL_NUMBERS = MappingProxyType({
+    'debug': DEBUG,
+    'info': INFO,
+    'warning': WARNING,
+    'error': ERROR,
+    'critical': CRITICAL
+})
+
+# Default user filters; a read-only view prevents the defaults from being modified by any single task or chain. The
+# list-type filters default to empty tuples because every task's copy of the defaults shares these values.
+USER_FILTERS = MappingProxyType({
+    'add_keys': (),
     'count': False,
-    'exclude_keys': [],
-    'headers': [],
+    'exclude_keys': (),
+    'headers': (),
     'limit': None,
-    'matches': [],
+    'matches': (),
     'sort': None
-}
+})
+
+# Shared by tasks which are not given `on` or `retry` directives so that each task does not allocate its own empty dict
+_EMPTY_MAPPING = MappingProxyType({})
 
 logger = getLogger('harvest')
 
+# The factories module imports this module, so it is bound on first use by _get_factories()
+_factories = None
+
+
+def _get_factories():
+    """
+    Returns the factories module, importing it on first use. The factories module cannot be imported at the top of this
+    module because it imports this module.
+    """
+
+    global _factories
+
+    if _factories is None:
+        from . import factories
+        _factories = factories
+
+    return _factories
+
+
+# The number of items measured at each level of a result by _estimate_size()
+_SIZE_SAMPLE = 100
+
+
+@lru_cache(maxsize=256)
+def _compile_error_pattern(pattern: str):
+    """
+    Compiles a `when_error_like` or `when_error_not_like` retry pattern. Compiled patterns are cached by their pattern
+    string, so a pattern is compiled once however often tasks are retried, while a task whose `retry` directive is
+    changed after it is created matches errors against its new patterns.
+
+    Args:
+        pattern (str): The regex pattern to compile. Patterns are matched case-insensitively.
+    """
+
+    return re_compile(pattern, IGNORECASE)
+
+
+def _estimate_size(value: Any, depth: int = 2) -> int:
+    """
+    Estimates the size of a value in bytes, including the values it contains. sys.getsizeof() only measures the
+    container itself, so a list of records would be reported as the size of the list's pointers. To keep the estimate
+    cheap for large results, at most _SIZE_SAMPLE items are measured at each level and the rest are assumed to be the
+    same size, and values nested deeper than `depth` are measured without their contents.
+
+    Args:
+        value (Any): The value to measure.
+        depth (int, optional): The number of levels of nested containers to measure. Defaults to 2.
+    """
+
+    size = getsizeof(value)
+
+    if depth <= 0:
+        return size
+
+    if isinstance(value, dict):
+        sample = list(islice(value.items(), _SIZE_SAMPLE))
+        sample_size = sum(_estimate_size(k, depth - 1) + _estimate_size(v, depth - 1) for k, v in sample)
+
+    elif isinstance(value, (list, tuple, set, frozenset, deque)):
+        sample = list(islice(value, _SIZE_SAMPLE))
+        sample_size = sum(_estimate_size(item, depth - 1) for item in sample)
+
+    else:
+        return size
+
+    if sample:
+        size += sample_size * len(value) // len(sample)
+
+    return size
+
 
 class TaskStatusCodes(Enum):
     """
@@ -63,6 +162,13 @@ class TaskStatusCodes(Enum):
     skipped = 'skipped'
     terminating = 'terminating'
 
+    def __str__(self) -> str:
+        return self._value_
+
+
+# The statuses in which a task has stopped and will not change status again
+TERMINAL_STATUS_CODES = frozenset({TaskStatusCodes.complete, TaskStatusCodes.error, TaskStatusCodes.skipped})
+
 
 class BaseTask:
     """
@@ -71,11 +177,49 @@ class BaseTask:
     subclasses that provide specific functionality.
     """
 
+    # Attributes assigned by BaseTask are stored in slots. Subclasses which do not declare __slots__ will still have a
+    # __dict__ for any additional attributes.
+    __slots__ = (
+        'name',
+        'blocking',
+        'data',
+        'description',
+        'iterate',
+        'on',
+        'output',
+        'result_as',
+        'retry',
+        'task_chain',
+        'when',
+        'attempts',
+        'original_template',
+        '_result',
+        'meta',
+        'start',
+        'end',
+        'user_filters',
+        'done_event',
+        '_chain_index',
+        '_end_monotonic',
+        '_result_bytes',
+        '_result_records',
+        '_start_monotonic',
+        '_status',
+        '_when_template',
+    )
+
     # By default, the user filter class is HarvestRecordSetUserFilter. This is because most tasks which return data do
     # so after the overarching data set has been retrieved. An example of this include the FileTask which reads a file
     # and returns the data.
     USER_FILTER_STAGE = 'complete'
 
+    # The maximum number of errors retained in meta['Errors']. Older errors are discarded first.
+    MAX_ERRORS = 16
+
+    # When False, generator results are converted to a list before on_complete() is called. Tasks whose results are
+    # only iterated once may set this to True to avoid holding the entire result in memory.
+    STREAMS_RESULT = False
+
     def __init__(self,
                  name: str,
                  blocking: bool = True,
@@ -118,7 +262,9 @@ class BaseTask:
             task_chain (BaseTaskChain): The task chain that this task belongs to, if applicable.
             retry (dict): A dictionary of retry configurations for the task.
                 >>> retry = {
+                >>>     'backoff': 'fixed',                    # 'fixed' or 'jitter' (exponential backoff with full jitter).
                 >>>     'delay_seconds': 1.0,                  # The number of seconds to delay before retrying the task.
+                >>>     'max_delay_seconds': 60.0,             # The longest delay when 'backoff' is 'jitter'.
                 >>>     'max_attempts': 3,                     # The maximum number
                 >>>     'when_error_like': '.*',               # A regex pattern to match the error message.
                 >>>     'when_error_not_like': '.*',           # A regex pattern to match the error message.
@@ -151,17 +297,22 @@ class BaseTask:
         self.data = data
         self.description = description
         self.iterate = iterate or {}
-        self.on = on or {}
+        self.on = on or _EMPTY_MAPPING
         self.output = None
         self.result_as = result_as
-        self.retry = retry or {}
+        self.retry = retry or _EMPTY_MAPPING
         self.task_chain = task_chain
         self.when = when
 
+        # The `when` condition is compiled on first use by _when_condition_met()
+        self._when_template = None
+
         # Programmatic attributes
         self.attempts = 0
-        self.status = TaskStatusCodes.initialized
+        self._status = TaskStatusCodes.initialized
         self.original_template = None
+
+        # Assigning the result also resets the measurements of the result's size and record count
         self.result = None
         self.meta = {
             'Errors': []
@@ -169,8 +320,26 @@ class BaseTask:
         self.start = None
         self.end = None
 
+        # The index of this task in its task chain, assigned by BaseTaskChain.append()
+        self._chain_index = -1
+
+        # Monotonic timestamps used to calculate the duration; start and end are retained for display
+        self._start_monotonic = None
+        self._end_monotonic = None
+
+        # Set once the task reaches a final state (complete, error, skipped) so that other threads may block on it
+        # instead of polling the task's status
+        self.done_event = Event()
+
         # Defaults < task-chain < user
-        self.user_filters = USER_FILTERS | self.task_chain.user_filters if self.task_chain else {} | (user_filters or {})
+        self.user_filters = USER_FILTERS.copy()
+
+        # BaseTaskChain is a list, so an empty chain is falsy
+        if self.task_chain is not None:
+            self.user_filters.update(self.task_chain.user_filters)
+
+        if user_filters:
+            self.user_filters.update(user_filters)
 
     @property
     def duration(self) -> float:
@@ -178,7 +347,29 @@ class BaseTask:
         Returns the duration of the task in seconds.
         """
 
-        return ((self.end or datetime.now(tz=timezone.utc)) - self.start).total_seconds() if self.start else -1
+        if self._start_monotonic is None:
+            return -1
+
+        return (self._end_monotonic or monotonic()) - self._start_monotonic
+
+    @property
+    def result(self) -> Any:
+        """
+        Returns the result of the task.
+        """
+
+        return self._result
+
+    @result.setter
+    def result(self, result: Any):
+        """
+        Sets the result of the task. The size and record count of the previous result no longer apply, so they are
+        measured again the next time they are reported.
+        """
+
+        self._result = result
+        self._result_bytes = None
+        self._result_records = None
 
     @property
     def errors(self) -> List[str]:
@@ -199,11 +390,28 @@ class BaseTask:
         0 when it is the first Task in the chain.
         """
 
-        try:
-            return self.task_chain.index(self)
+        return self._chain_index if self.task_chain is not None else -1
 
-        except ValueError:
-            return -1
+    @property
+    def status(self) -> TaskStatusCodes:
+        """
+        Returns the current status of the task.
+        """
+
+        return self._status
+
+    @status.setter
+    def status(self, status: TaskStatusCodes):
+        """
+        Sets the status of the task. When the task belongs to a task chain, the chain sets the status so that its status
+        counts are updated in the same step.
+        """
+
+        if self.task_chain is None:
+            self._status = status
+
+        else:
+            self.task_chain._set_task_status(self, status)
 
     def apply_user_filters(self):
         """
@@ -215,6 +423,12 @@ class BaseTask:
         if self.user_filters.get('accepted') is None:
             return
 
+        # There is nothing to filter or every filter is unset. The defaults are all empty, so a filter which is given
+        # as an empty list is treated the same as its default. An empty result is still counted.
+        user_filters = self.user_filters
+        if (not self.result and not user_filters.get('count')) or not any(user_filters.get(k) for k in USER_FILTERS):
+            return
+
         from ..user_filters import HarvestRecordSetUserFilter
 
         with HarvestRecordSetUserFilter(recordset=self.result, **self.user_filters) as user_filter:
@@ -229,10 +443,9 @@ class BaseTask:
         for i in range(10):
 
             # Make sure to include a block which handles termination
-            if str(self.status) == str(TaskStatusCodes.terminating):
+            if self.status is TaskStatusCodes.terminating:
                 raise TaskTerminationException('Task was instructed to terminate.')
 
-            from time import sleep
             sleep(1)
 
         # Set the data attribute to the result of the task, otherwise `as_result` will not populate.
@@ -263,9 +476,7 @@ class BaseTask:
 
                     # Check of the `when` condition is met
                     if self.when and self.task_chain:
-                        from .templating import template_object
-                        when_result = True if template_object(template={'result': '{{ ' + self.when + ' }}'},
-                                                              variables=self.task_chain.variables).get('result') == 'True' else False
+                        when_result = self._when_condition_met()
 
                     # If `self.when` condition is met or is None, run the method
                     if when_result:
@@ -279,32 +490,28 @@ class BaseTask:
                     # If the `retry` directive is provided, check if the task should be retried. We include isinstance()
                     # to ensure that the retry directive is a dictionary.
                     if self.retry and isinstance(self.retry, dict):
-                        from re import findall, IGNORECASE
-
-                        # Collect the retry conditions
+                        # Check the cheapest conditions first so that the error patterns are only searched when the
+                        # task could otherwise be retried
                         retry = (
-                            # Check if the error is in the retry directive
-                            findall(self.retry.get('when_error_like') or '.*', str(ex.args), flags=IGNORECASE)
-                            if self.retry.get('when_error_like') else True,
-
-                            # Check if the error is not in the retry directive
-                            not findall(self.retry.get('when_error_not_like') or '.*', str(ex.args), flags=IGNORECASE)
-                            if self.retry.get('when_error_not_like') else True,
-
                             # Check if the number of attempts is less than the maximum number of attempts
-                            self.attempts < max_attempts,
+                            self.attempts < max_attempts
 
                             # Check if the task is not terminating
-                            str(self.status) != str(TaskStatusCodes.terminating)
-                        )
+                            and self.status is not TaskStatusCodes.terminating
 
-                        retry = all(retry)
+                            # Check if the error is in the retry directive
+                            and (not self.retry.get('when_error_like')
+                                 or _compile_error_pattern(self.retry['when_error_like']).search(str(ex.args)) is not None)
+
+                            # Check if the error is not in the retry directive
+                            and (not self.retry.get('when_error_not_like')
+                                 or _compile_error_pattern(self.retry['when_error_not_like']).search(str(ex.args)) is None)
+                        )
 
                         # If any of the above conditions are met and the number of attempts is less than the maximum
                         # number of attempts, retry the task. Otherwise, call the on_error() method.
                         if retry:
-                            from time import sleep
-                            sleep(self.retry.get('delay_seconds') or 1.0)
+                            sleep(self._retry_delay())
                             continue
 
                         # If the task should not be retried, call the on_error() method
@@ -319,17 +526,15 @@ class BaseTask:
 
                 else:
                     # If the task was not skipped, call the on_complete() method
-                    if str(self.status) != str(TaskStatusCodes.skipped):
+                    if self.status is not TaskStatusCodes.skipped:
 
                         # If the result is a generator, convert it to a list. We do this at this stage instead of
                         # inside the on_complete() method to make sure any post-task processing will be handled on the
                         # entire data result instead against a generator which may not be accessible following the
                         # completion of self.method(). Additionally, on_complete() can be overwritten so it is possible
                         # this crucial step may be missed.
-
-                        from types import GeneratorType
-                        if isinstance(self.result, GeneratorType):
-                            self.result = [r for r in self.result]
+                        if isinstance(self.result, GeneratorType) and not self.STREAMS_RESULT:
+                            self.result = list(self.result)
 
                         self.on_complete()
                         break
@@ -339,15 +544,87 @@ class BaseTask:
             raise BaseTaskException(f'Top level error while running task {self.name}: {ex}')
 
         finally:
+            self._measure_result()
+
             # Update the metadata with the task's status, duration, and other information
-            self.meta = self.meta | {
+            self.meta.update({
                 'attempts': self.attempts,
-                'count': len(self.result) if hasattr(self, '__len__') else 1,
+                # Results without a length, such as a single record, are counted as one
+                'count': 1 if self._result_records is None else self._result_records,
                 'duration': self.duration,
-                'status': str(self.status)
-            }
+                'status': self.status.value
+            })
         return self
 
+    def _measure_result(self) -> None:
+        """
+        Records the estimated size of the result in bytes and the number of records in the result so that reports do not
+        need to measure the result every time they are generated. Results without a length have no record count.
+        """
+
+        result = self.result
+
+        try:
+            self._result_records = len(result)
+
+        except TypeError:
+            self._result_records = None
+
+        self._result_bytes = _estimate_size(result)
+
+    def _record_error(self, ex: Exception, message: str = None) -> None:
+        """
+        Records an error in meta['Errors'] as '<exception type>: <message>'. Only the most recent MAX_ERRORS errors are
+        kept. The errors are kept as a list of strings because the task's metadata is reported and cached as JSON.
+
+        Args:
+            ex (Exception): The exception that occurred.
+            message (str, optional): The message to record. Defaults to str(ex).
+        """
+
+        errors = self.meta['Errors']
+        errors.append(f'{type(ex).__name__}: {str(ex) if message is None else message}')
+        del errors[:-self.MAX_ERRORS]
+
+    def _retry_delay(self) -> float:
+        """
+        Returns the number of seconds to wait before the next attempt. With the 'jitter' backoff, the delay is a random
+        value between zero and `delay_seconds` doubled for each previous attempt, capped at `max_delay_seconds`. This
+        keeps tasks which fail together from retrying together.
+
+        Like the error patterns checked by run(), the delay settings are read from `retry` on each attempt, so changes
+        to the directive after the task is created take effect on the next retry.
+        """
+
+        delay_seconds = self.retry.get('delay_seconds') or 1.0
+
+        if self.retry.get('backoff') == 'jitter':
+            max_delay_seconds = self.retry.get('max_delay_seconds') or 60.0
+
+            return uniform(0, min(max_delay_seconds, delay_seconds * 2 ** (self.attempts - 1)))
+
+        return delay_seconds
+
+    def _when_condition_met(self) -> bool:
+        """
+        Evaluates the `when` condition against the task chain's variables. The condition is compiled on the first attempt
+        and the compiled template is reused by any retries.
+
+        Returns:
+            bool: True if the condition rendered as 'True', otherwise False.
+        """
+
+        try:
+            if self._when_template is None:
+                self._when_template = get_environment().from_string('{{ ' + self.when + ' }}')
+
+            return self._when_template.render(**self.task_chain.variables) == 'True'
+
+        except Exception as ex:
+            logger.warning(f'Error rendering template: {ex}')
+
+            return False
+
     def _run_on_directive(self, directive: str):
         """
         Runs the task directive specified by the caller.
@@ -359,19 +636,38 @@ class BaseTask:
             BaseTask: The instance of the task.
         """
 
-        i = 1
+        directives = self.on.get(directive)
+
+        if not directives:
+            return self
+
+        # Blocking tasks run their directives next. Non-blocking tasks append their directives to the end of the chain
+        # since the position of the current task is not known.
+        self.task_chain._enqueue(directives, after=self if self.blocking else None)
+
+        return self
+
+    def _finish(self, status: TaskStatusCodes, directive: str) -> 'BaseTask':
+        """
+        Moves the task into a final state. The directive runs first so that its tasks are queued before anything
+        waiting on the task is released.
+
+        Args:
+            status (TaskStatusCodes): The final status of the task (complete, error, or skipped).
+            directive (str): The name of the `on` directive to run.
+
+        Returns:
+            BaseTask: The instance of the task.
+        """
 
-        for d in (self.on.get(directive) or []):
-            # If the task is blocking, insert the new task before the next task in the chain
-            if self.blocking:
-                self.task_chain.task_templates.insert(self.task_chain.position + i, d)
+        self._run_on_directive(directive)
 
-            # If the task is not blocking, append the new task to the end of the chain since the position of the current
-            # task is not known.
-            else:
-                self.task_chain.task_templates.append(d)
+        # Update the end time of the task
+        self.end = datetime.now(tz=timezone.utc)
+        self._end_monotonic = monotonic()
 
-            i += 1
+        self.status = status
+        self.done_event.set()
 
         return self
 
@@ -392,16 +688,7 @@ class BaseTask:
         if self.USER_FILTER_STAGE == 'complete':
             self.apply_user_filters()
 
-        # Run the on_complete directive
-        self._run_on_directive('complete')
-
-        # Update the end time of the task
-        self.end = datetime.now(tz=timezone.utc)
-
-        # Update the status of the task
-        self.status = TaskStatusCodes.complete
-
-        return self
+        return self._finish(TaskStatusCodes.complete, 'complete')
 
     def on_error(self, ex: Exception) -> 'BaseTask':
         """
@@ -415,16 +702,12 @@ class BaseTask:
             BaseTask: The instance of the task.
         """
 
-        self.status = TaskStatusCodes.error
-
         if hasattr(ex, 'args'):
-            self.meta['Errors'].append(str(ex.args))
+            self._record_error(ex)
 
         logger.error(f'Error running task {self.name}: {ex}')
 
-        self._run_on_directive('error')
-
-        return self
+        return self._finish(TaskStatusCodes.error, 'error')
 
     def on_skipped(self) -> 'BaseTask':
         """
@@ -435,11 +718,7 @@ class BaseTask:
             BaseTask: The instance of the task.
         """
 
-        self.status = TaskStatusCodes.skipped
-
-        self._run_on_directive('skipped')
-
-        return self
+        return self._finish(TaskStatusCodes.skipped, 'skipped')
 
     def on_start(self) -> 'BaseTask':
         """
@@ -452,6 +731,7 @@ class BaseTask:
 
         self.status = TaskStatusCodes.running
         self.start = datetime.now(tz=timezone.utc)
+        self._start_monotonic = monotonic()
 
         self._run_on_directive('start')
 
@@ -476,6 +756,8 @@ class BaseTask:
 
 
 class BaseAuthenticationTask(BaseTask):
+    __slots__ = ('auth',)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -489,6 +771,8 @@ class BaseDataTask(BaseTask):
     provide specific functionality.
     """
 
+    __slots__ = ('silo', 'arguments', 'command', 'calls', 'cache_ttl', '_base_command_part')
+
     # The connection key map is used to map the connection attributes to the appropriate attributes in the subclass.
     # base_configration_key: The attribute in the BaseDataTask class.
     # driver_configuration_key: The attribute specific to the data provider driver / module.
@@ -511,9 +795,22 @@ class BaseDataTask(BaseTask):
     # specific configuration keys.
     REQUIRED_CONFIGURATION_KEYS = ()
 
+    # Only commands listed here are cached, even when `cache_ttl` is set, so that commands which write to the data
+    # provider always run. Override this attribute in subclasses to list the data provider's read-only commands.
+    READ_ONLY_COMMANDS = frozenset()
+
+    # Results of tasks which opted in with `cache_ttl` are shared across all data tasks in the process. Entries are
+    # keyed by cache_key_parts(); the least recently used entries are evicted past RESULT_CACHE_SIZE. Results are
+    # copied in and out of the cache so that no task can modify another task's result.
+    # Format: {key: (expires_at, result)}
+    RESULT_CACHE_SIZE = 128
+    _RESULT_CACHE = OrderedDict()
+    _RESULT_CACHE_LOCK = Lock()
+
     def __init__(self, command: str,
                  silo: str,
                  arguments: dict = None,
+                 cache_ttl: float = 0,
                  *args, **kwargs):
         """
         Initializes a new instance of the BaseDataTask class. In order to instantiate a BaseDataTask, a configuration
@@ -528,20 +825,22 @@ class BaseDataTask(BaseTask):
             command (str): The command to run on the data provider.
             arguments (dict, optional): Arguments to pass to the command.
             silo (str, optional): The name of the silo to use for the task. Defaults to None.
-\        """
+            cache_ttl (float, optional): When greater than zero, identical read-only commands run within this many seconds
+                reuse the previous result instead of querying the data provider. Defaults to 0.
+        """
 
         # Initialize the BaseTask class
         super().__init__(*args, **kwargs)
 
-        from ..silos import get_silo
-
         # Assigned attributes
         self.silo = get_silo(silo)
         self.arguments = arguments or {}
         self.command = command
+        self.cache_ttl = cache_ttl
 
         # Programmatic attributes
         self.calls = 0
+        self._base_command_part = None
 
     def __enter__(self):
         return self
@@ -553,17 +852,80 @@ class BaseDataTask(BaseTask):
     def base_command_part(self):
         """
         Extracts the actual command from 'self.command' and returns it while preserving the path of the original command.
+        The command does not change once the task is created, so the result is cached.
+        """
+
+        if self._base_command_part is None:
+            command = self.command
+
+            if '.' in command:
+                # Extract the command from the string
+                command = command.partition('.')[0]
+
+            elif '[' in command and ']' in command:
+                # Extract the command from the string
+                command = command.partition('[')[0]
+
+            self._base_command_part = command
+
+        return self._base_command_part
+
+    def is_read_only(self) -> bool:
+        """
+        Returns True when the task's command does not change the data provider, meaning its result may be cached.
         """
 
-        result = self.command
+        return self.base_command_part in self.READ_ONLY_COMMANDS
 
-        if '.' in self.command:
-            # Extract the command from the string
-            result = self.command.split('.')[0]
+    def cache_key_parts(self) -> tuple:
+        """
+        Returns the values which identify the task's result in the result cache. Subclasses should extend this tuple with
+        any attribute which changes the result of the command, such as the collection a command runs against. Only the
+        base command is included because the cached result is the command's result before its path is walked.
+        """
+
+        return type(self).__name__, self.silo.name, self.base_command_part, self.arguments
+
+    def cached_result(self, execute) -> Any:
+        """
+        Returns the result of `execute()`, reusing a previous result with the same cache_key_parts() when `cache_ttl` is
+        set, the command is read-only, and the previous result has not expired. Iterators, such as database cursors, are
+        not cached because they can only be consumed once.
+
+        `execute()` should return the command's result before walk_result_command_path() is applied, and the caller
+        should walk the returned result, so that a cached result is walked the same way as a new one.
+
+        Arguments
+        execute (callable): A callable which queries the data provider and returns the result.
+        """
+
+        if not self.cache_ttl or not self.is_read_only():
+            return execute()
+
+        key = sha256(dumps(self.cache_key_parts(), sort_keys=True, default=str).encode()).hexdigest()
+        cache = self._RESULT_CACHE
 
-        elif '[' and ']' in self.command:
-            # Extract the command from the string
-            result = self.command.split('[')[0]
+        with self._RESULT_CACHE_LOCK:
+            entry = cache.get(key)
+
+            if entry is not None:
+                if entry[0] > monotonic():
+                    cache.move_to_end(key)
+                    return deepcopy(entry[1])
+
+                del cache[key]
+
+        result = execute()
+
+        if isinstance(result, Iterator):
+            return result
+
+        with self._RESULT_CACHE_LOCK:
+            cache[key] = (monotonic() + self.cache_ttl, deepcopy(result))
+            cache.move_to_end(key)
+
+            while len(cache) > self.RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
 
         return result
 
@@ -581,13 +943,12 @@ class BaseDataTask(BaseTask):
         >>> 10
         """
 
-        if '.' in self.command or ('[' and ']') in self.command:
+        if '.' in self.command or ('[' in self.command and ']' in self.command):
             # Walk the command path and return the result, if applicable
             self.task_chain.variables[self.base_command_part] = result
 
             # Walks the command path and returns the result. This allows commands such as MongoDb's 'find.row_count'.
-            from .factories import replace_variable_path_with_value
-            result: Any = replace_variable_path_with_value(original_string=f'var.{self.command}',
+            result: Any = _get_factories().replace_variable_path_with_value(original_string=f'var.{self.command}',
                                                            task_chain=self.task_chain,
                                                            fail_on_unassigned=True)
 
@@ -633,6 +994,17 @@ class BaseTaskChain(List[BaseTask]):
         terminate() -> 'BaseTaskChain': Terminates the task chain.
     """
 
+    # The number of seconds between job cache updates for each status. Statuses which are not listed update every second.
+    CACHE_UPDATE_SECONDS = MappingProxyType({
+        TaskStatusCodes.initialized: 5,
+        TaskStatusCodes.idle: 5,
+    })
+
+    # The columns of each row reported by performance_metrics, in display order
+    PERFORMANCE_METRICS_HEADERS = (
+        'Position', 'Name', 'Status', 'Attempts', 'DataBytes', 'Records', 'Duration', 'Start', 'End'
+    )
+
     def __init__(self,
                  template: dict,
                  user_filters: dict = None,
@@ -657,7 +1029,7 @@ class BaseTaskChain(List[BaseTask]):
 
         super().__init__()
 
-        from uuid import uuid4
+        # Generated here rather than on first use because the job cache thread reads it while __init__ is running
         self.id = str(uuid4())
 
         self.name = template['name']
@@ -669,20 +1041,33 @@ class BaseTaskChain(List[BaseTask]):
 
         self.task_templates: List[dict or BaseTask] = template.get('tasks', [])
 
+        # Name indexes used by find_task_by_name() and find_task_position_by_name(). The task index is maintained by
+        # append() while the template index is built on demand and discarded whenever the templates are modified.
+        self._task_name_index: Dict[str, BaseTask] = {}
+        self._template_name_index: Dict[str, int] or None = None
+
+        # The number of tasks in the chain with each status, maintained by append() and _set_task_status()
+        self._status_counts: Dict[TaskStatusCodes, int] = {code: 0 for code in TaskStatusCodes}
+        self._status_counts_lock = Lock()
+
         self.status = TaskStatusCodes.initialized
-        self.pool = BaseTaskPool(chain=self,
-                                 max_workers=template.get('max_workers', 4),
-                                 idle_refresh_rate=template.get('idle_refresh_rate', 3),
-                                 worker_refresh_rate=template.get('worker_refresh_rate', .5)).start()
 
         self.position = 0
 
         self.start = None
         self.end = None
+
+        # Monotonic timestamps used to calculate the duration; start and end are retained for display
+        self._start_monotonic = None
+        self._end_monotonic = None
+
         self.user_filters = USER_FILTERS | (user_filters or {})
 
         self.meta = {}
 
+        # Set when the chain completes so that the job cache thread writes its final update without waiting out its
+        # update interval
+        self._cache_update_event = Event()
         self.reporting_thread = self.update_task_chain_cache_thread()
 
     def __enter__(self) -> 'BaseTaskChain':
@@ -709,6 +1094,57 @@ class BaseTaskChain(List[BaseTask]):
 
         return None
 
+    def append(self, task: BaseTask) -> None:
+        """
+        Adds a task to the end of the task chain and records its index on the task so that BaseTask.position does not
+        need to search the chain.
+
+        Args:
+            task (BaseTask): The task to add to the task chain.
+        """
+
+        # The first task with a given name is the one returned by find_task_by_name()
+        self._task_name_index.setdefault(task.name, task)
+
+        # The index is assigned under the lock so that the task's status is counted exactly once
+        with self._status_counts_lock:
+            task._chain_index = len(self)
+            self._status_counts[task._status] += 1
+
+        super().append(task)
+
+    def _set_task_status(self, task: BaseTask, status: TaskStatusCodes) -> None:
+        """
+        Sets the status of a task belonging to the chain and updates the status counts. Called by BaseTask.status. The
+        previous status is read and replaced under the lock so that two threads changing the status of the same task,
+        such as a worker finishing the task while the pool terminates it, cannot both count the task leaving the same
+        status.
+
+        Args:
+            task (BaseTask): The task whose status is changing.
+            status (TaskStatusCodes): The status the task is entering.
+        """
+
+        with self._status_counts_lock:
+            previous_status = task._status
+            task._status = status
+
+            # Tasks which have not been added to the chain are not counted
+            if task._chain_index >= 0 and previous_status is not status:
+                self._status_counts[previous_status] -= 1
+                self._status_counts[status] += 1
+
+    @property
+    def duration(self) -> float:
+        """
+        Returns the duration of the task chain in seconds.
+        """
+
+        if self._start_monotonic is None:
+            return -1
+
+        return (self._end_monotonic or monotonic()) - self._start_monotonic
+
     @property
     def errors(self) -> List[dict]:
         """
@@ -716,9 +1152,9 @@ class BaseTaskChain(List[BaseTask]):
         """
 
         errors = []
-        for task in self:
+        for index, task in enumerate(self):
             if task.meta.get('Errors'):
-                errors.append({f'{self.index(task)}-{task.name}': task.meta['Errors']})
+                errors.append({f'{index}-{task.name}': task.errors})
 
         if self.meta.get('Errors'):
             errors.append({'TaskChain': self.meta['Errors']})
@@ -784,49 +1220,52 @@ class BaseTaskChain(List[BaseTask]):
             List[dict]: A dictionary representing the performance metrics of the task chain.
         """
 
-        from sys import getsizeof
+        # This part of the report returns results for each task in the task chain. The totals for the entire task chain
+        # are accumulated in the same pass.
+        task_metrics = []
+        total_records = 0
+        total_result_size = 0
+        starts = None
+        ends = None
 
-        # This part of the report returns results for each task in the task chain.
-        task_metrics = [
-            {
-                'Position': self.position,
+        for position, task in enumerate(self):
+            # Tasks are measured when they finish running; tasks which never ran are measured now
+            if task._result_bytes is None:
+                task._measure_result()
+
+            result_size = task._result_bytes
+            records = task._result_records
+
+            task_metrics.append({
+                'Position': position,
                 'Name': task.name,
-                'Status': task.status.__str__(),
+                'Status': task.status.value,
                 'Attempts': task.attempts,
-                'DataBytes': getsizeof(task.result),
-                'Records': len(task.result) if hasattr(task.result, '__len__') else 'N/A',
+                'DataBytes': result_size,
+                'Records': 'N/A' if records is None else records,
                 'Duration': task.duration,
                 'Start': task.start,
                 'End': task.end,
-            }
-            for task in self
-        ]
+            })
 
-        # Gather metrics for the entire task chain
-        # We generate multiple lists through one loop to perform the necessary calculations without having to loop
-        # multiple times through the TaskChain's tasks.
-        total_records = []
-        total_result_size = []
-        starts = []
-        ends = []
-        for task in self:
-            if hasattr(task.result, '__len__'):
-                total_records.append(len(task.result))
-
-            total_result_size.append(getsizeof(task.result))
-            starts.append(task.start)
-            ends.append(task.end)
+            total_records += records or 0
+            total_result_size += result_size
 
-        # Add a total row to the task metrics
-        total_records = sum(total_records)
-        total_result_size = sum(total_result_size)
-        starts = min(starts)
-        ends = max(ends)
+            # Tasks which never started (such as skipped iteration parents) have no start or end time
+            if task.start is not None and (starts is None or task.start < starts):
+                starts = task.start
+
+            if task.end is not None and (ends is None or task.end > ends):
+                ends = task.end
 
+        # Add a buffer row between the task list and the Total
+        task_metrics.append(dict.fromkeys(self.PERFORMANCE_METRICS_HEADERS, ''))
+
+        # Add a total row to the task metrics
         task_metrics.append({
             'Position': 'Total',
             'Name': '',
-            'Status': self.status.__str__(),
+            'Status': self.status.value,
             'Records': total_records,
             'DataBytes': total_result_size,
             'Duration': (ends - starts).total_seconds() if starts and ends else 0,
@@ -834,39 +1273,39 @@ class BaseTaskChain(List[BaseTask]):
             'End': ends,
         })
 
-        # Add a buffer run between the task list and the Total
-        # We add it at this stage just in case there are no Tasks in the TaskChain
-        # which means the only row in the task_metrics list is the Total row
-        task_metrics.insert(-1, {k: '' for k in task_metrics[-1].keys()})
-
         return [
             {
                 'data': task_metrics,
                 'meta': {
-                    'headers': [k for k in task_metrics[0].keys()]
+                    'headers': list(self.PERFORMANCE_METRICS_HEADERS)
                 }
             }
         ]
 
+    @cached_property
+    def pool(self) -> 'BaseTaskPool':
+        """
+        Returns the task pool used to run non-blocking tasks. The pool and its minder thread are only created once the
+        chain needs them, so chains which are never run do not start a thread.
+        """
+
+        return BaseTaskPool(chain=self,
+                            max_workers=self.original_template.get('max_workers', 4),
+                            idle_refresh_rate=self.original_template.get('idle_refresh_rate', 3),
+                            worker_refresh_rate=self.original_template.get('worker_refresh_rate', .5),
+                            max_complete_history=self.original_template.get('max_complete_history', 10000)).start()
+
     @property
     def result(self) -> dict:
         """
         Returns either `var.result` or the result of the last task in the task chain.
         """
 
-        result = None
-
-        try:
-            result = self.variables.get('result') or self[-1].result
-
-        except IndexError:
-            result = None
-
-        finally:
-            return {
-                'data': result,
-                'meta': self.meta
-            }
+        # An empty chain has no last task to take the result from
+        return {
+            'data': self.variables.get('result') or (self[-1].result if len(self) else None),
+            'meta': self.meta
+        }
 
     @property
     def total(self) -> int:
@@ -891,22 +1330,20 @@ class BaseTaskChain(List[BaseTask]):
             dict: A dictionary representing the progress of the task chain.
         """
 
-        from datetime import datetime, timezone
-
-        # Set the possible status codes based on the TaskStatusCodes Enum
-        count_result = {
-            str(k): 0 for k in TaskStatusCodes
-        }
+        # The status counts are maintained as tasks are added to the chain and change status
+        with self._status_counts_lock:
+            count_result = {
+                code.value: count for code, count in self._status_counts.items()
+            }
 
-        # Now we count the number of tasks in each status
-        for task in self:
-            count_result[str(task.status)] += 1
+        total = self.total
 
         return {
-            'total': self.total,
+            'total': total,
             'current': self.position,
-            'percent': (self.position / self.total) * 100,
-            'duration': (self.end or datetime.now(tz=timezone.utc) - self.start).total_seconds() if self.start else 0,
+            # A chain without any task templates has no progress to report
+            'percent': self.position * 100 / total if total else 0,
+            'duration': self.duration if self._start_monotonic is not None else 0,
             'counts': count_result
         }
 
@@ -921,9 +1358,7 @@ class BaseTaskChain(List[BaseTask]):
             BaseTask: The task with the given name.
         """
 
-        for task in self:
-            if task.name == task_name:
-                return task
+        return self._task_name_index.get(task_name)
 
     def find_task_position_by_name(self, task_name: str) -> int:
         """
@@ -936,9 +1371,22 @@ class BaseTaskChain(List[BaseTask]):
             int: The position of the task in the task chain. If the task is not found, it returns None.
         """
 
-        for position, task in enumerate(self.task_templates):
-            if task.name == task_name:
-                return position
+        if self._template_name_index is None:
+            template_name_index = {}
+
+            for position, task in enumerate(self.task_templates):
+                # Templates may be task configurations ({class_name: {configuration}}) or instantiated tasks
+                if isinstance(task, BaseTask):
+                    name = task.name
+
+                else:
+                    name = (list(task.values())[0] or {}).get('name')
+
+                template_name_index.setdefault(name, position)
+
+            self._template_name_index = template_name_index
+
+        return self._template_name_index.get(task_name)
 
     def get_variables_by_names(self, *variable_names) -> dict:
         """
@@ -951,10 +1399,11 @@ class BaseTaskChain(List[BaseTask]):
         Returns: a dictionary of variable names (keys) and their values.
         """
 
+        # Look up the requested names rather than scanning every variable
         return {
-            key: value
-            for key, value in self.variables.items()
-            if key in variable_names
+            name: self.variables[name]
+            for name in variable_names
+            if name in self.variables
         }
 
     def insert_task_after_name(self, task_name: str, new_task_configuration: dict or BaseTask) -> 'BaseTaskChain':
@@ -969,7 +1418,7 @@ class BaseTaskChain(List[BaseTask]):
             BaseTaskChain: The instance of the task chain.
         """
 
-        self.task_templates.insert(self.find_task_position_by_name(task_name) + 1, new_task_configuration)
+        self._insert_templates(self.find_task_position_by_name(task_name) + 1, [new_task_configuration])
 
         return self
 
@@ -991,7 +1440,7 @@ class BaseTaskChain(List[BaseTask]):
             raise BaseTaskException('Cannot insert a task before the current task.')
 
         else:
-            self.task_templates.insert(position - 1, new_task_configuration)
+            self._insert_templates(position - 1, [new_task_configuration])
 
         return self
 
@@ -1007,11 +1456,73 @@ class BaseTaskChain(List[BaseTask]):
             BaseTaskChain: The instance of the task chain.
         """
 
-        if position > self.total:
-            self.task_templates.append(new_task_configuration)
+        self._insert_templates(None if position > self.total else position, [new_task_configuration])
+
+        return self
+
+    def _enqueue(self, task_configurations: List[dict or BaseTask], after: BaseTask = None) -> 'BaseTaskChain':
+        """
+        Adds task configurations to the task chain in a single operation.
+
+        Args:
+            task_configurations (List[dict or BaseTask]): The task configurations to add.
+            after (BaseTask, optional): When provided, the new tasks are inserted immediately after this task so that they
+                run next. A task which has not been added to the chain is treated as the chain's current task.
+                Otherwise, the new tasks are appended to the end of the chain.
+
+        Returns:
+            BaseTaskChain: The instance of the task chain.
+        """
+
+        if after is None:
+            position = None
 
         else:
-            self.task_templates.insert(position, new_task_configuration)
+            # Chain indexes match template positions because tasks are appended in template order
+            position = (after._chain_index if after._chain_index >= 0 else self.position) + 1
+
+        return self._insert_templates(position, task_configurations)
+
+    def _insert_templates(self, position: int or None, task_configurations: List[dict or BaseTask]) -> 'BaseTaskChain':
+        """
+        Inserts task configurations into the task chain's templates in a single operation. All changes to the templates
+        made by the task chain go through this method so that the template name index can be discarded.
+
+        Args:
+            position (int or None): The position at which to insert the task configurations. When None, the task
+                configurations are appended to the end of the templates.
+            task_configurations (List[dict or BaseTask]): The task configurations to insert.
+
+        Returns:
+            BaseTaskChain: The instance of the task chain.
+        """
+
+        if position is None:
+            self.task_templates.extend(task_configurations)
+
+        else:
+            self.task_templates[position:position] = task_configurations
+
+        self._template_name_index = None
+
+        return self
+
+    def _started_pool(self) -> 'BaseTaskPool' or None:
+        """
+        Returns the task pool if it has been created. Unlike the pool property, this does not create the pool.
+        """
+
+        # cached_property stores the pool in the instance dictionary once it has been created
+        return self.__dict__.get('pool')
+
+    def _wait_for_pool(self) -> 'BaseTaskChain':
+        """
+        Blocks until the task pool has no pending or running tasks. Chains which never used the pool return immediately.
+        """
+
+        pool = self._started_pool()
+        if pool is not None:
+            pool.wait_until_complete()
 
         return self
 
@@ -1020,12 +1531,18 @@ class BaseTaskChain(List[BaseTask]):
         Method to run when the task chain completes.
         This method may be overridden in subclasses to provide specific completion logic.
 
+        run() always calls this method when it finishes, so a chain which errored or was terminated keeps that status.
+
         Returns:
             BaseTaskChain: The instance of the task chain.
         """
 
-        self.status = TaskStatusCodes.complete
+        if self.status not in (TaskStatusCodes.error, TaskStatusCodes.terminating):
+            self.status = TaskStatusCodes.complete
+
         self.end = datetime.now(tz=timezone.utc)
+        self._end_monotonic = monotonic()
+        self._cache_update_event.set()
 
         return self
 
@@ -1041,8 +1558,9 @@ class BaseTaskChain(List[BaseTask]):
         self.status = TaskStatusCodes.error
         self.meta['Error'] = ex.args
 
-        if self.pool.queue_size:
-            self.pool.terminate()
+        pool = self._started_pool()
+        if pool is not None and pool.queue_size:
+            pool.terminate()
 
         logger.error(f'Error running task chain {self.name}: {ex}')
 
@@ -1056,6 +1574,7 @@ class BaseTaskChain(List[BaseTask]):
 
         self.status = TaskStatusCodes.running
         self.start = datetime.now(tz=timezone.utc)
+        self._start_monotonic = monotonic()
 
         return self
 
@@ -1068,6 +1587,8 @@ class BaseTaskChain(List[BaseTask]):
             BaseTaskChain: The instance of the task chain.
         """
 
+        task_from_dict = _get_factories().task_from_dict
+
         try:
             self.on_start()
             self.position = 0
@@ -1075,7 +1596,6 @@ class BaseTaskChain(List[BaseTask]):
             while True:
                 # Instantiate the task from the task configuration
                 try:
-                    from .factories import task_from_dict
                     task_template = self.task_templates[self.position]
 
                     task = task_from_dict(task_configuration=task_template, task_chain=self)
@@ -1084,11 +1604,14 @@ class BaseTaskChain(List[BaseTask]):
                         task.status = TaskStatusCodes.skipped
                         task.meta['Info'] = 'Task was skipped because it was an iterated task.'
 
-                        # Insert the iterated tasks into the task chain's configurations
-                        [
-                            self.task_templates.insert(self.position + 1, iter_task)
-                            for iter_task in self.iterate_task(original_task_configuration=task_template)
-                        ]
+                        # The parent never runs, so release anything waiting on it, such as a WaitTask
+                        task.done_event.set()
+
+                        # Insert the iterated tasks into the task chain's configurations. Inserting them as a single
+                        # batch preserves the order of the iterated items and shifts the remaining templates only once.
+                        self._insert_templates(self.position + 1,
+                                               list(self.iterate_task(original_task_configuration=task_template,
+                                                                      task=task)))
 
                         # Add the parent task to the task chain (it will not be executed)
                         self.append(task)
@@ -1112,20 +1635,20 @@ class BaseTaskChain(List[BaseTask]):
                     self.pool.add(task)
 
                 # Check for termination
-                if str(self.status) == str(TaskStatusCodes.terminating):
+                if self.status is TaskStatusCodes.terminating:
                     raise TaskTerminationException('Task chain was instructed to terminate.')
 
                 # Hold within the loop if there are outstanding pool tasks because the async task might have an
                 # on_* directive which needs to be added and processed. By waiting here, we ensure that the task chain
-                # will not complete until all tasks have been processed.
-                if self.pool.queue_size > 0 and len(self.task_templates) == len(self):
-                    self.pool.wait_until_complete()
+                # will not complete until all tasks have been processed. The wait returns immediately when the pool is
+                # idle, so the queue size does not need to be checked first.
+                if len(self.task_templates) == len(self):
+                    self._wait_for_pool()
 
                 # Increment the position
                 self.position += 1
 
-            if self.pool.queue_size > 0:
-                self.pool.wait_until_complete()
+            self._wait_for_pool()
 
         except Exception as ex:
             self.on_error(ex)
@@ -1142,13 +1665,15 @@ class BaseTaskChain(List[BaseTask]):
 
             return self
 
-    def iterate_task(self, original_task_configuration: dict) -> List[dict]:
+    def iterate_task(self, original_task_configuration: dict, task: BaseTask = None) -> List[dict]:
         """
         This generator converts a task_configuration with an 'iterate' directive into a list of task configurations
         based on the elements of 'iterate.variable'.
 
         Args:
             original_task_configuration (dict): The original task configuration with the 'iterate' directive.
+            task (BaseTask, optional): The task already instantiated from original_task_configuration. When provided,
+                                       its templated 'iterate' directive is used instead of instantiating the task again.
         """
 
         # Determine how results from the itemized processes will be stored. The default behavior is to override the
@@ -1173,34 +1698,39 @@ class BaseTaskChain(List[BaseTask]):
 
         # Template the original configuration to get the iterated items. We take this approach to leverage the templating
         # engine to resolve variables in the iterate directive.
-        from .factories import task_from_dict
-        task = task_from_dict(task_configuration=original_task_configuration, task_chain=self)
+        if task is None:
+            task = _get_factories().task_from_dict(task_configuration=original_task_configuration, task_chain=self)
+
         iter_var = task.iterate.get('variable')
 
-        # We employ reversed() here because we want the order of the tasks to be the same as the order of the iterated
-        # items. This is because the list.insert() operation will insert the new task at the specified position and
-        # shift the existing tasks down the task order. If we iterate in the normal order, the tasks will be performed
-        # in the reverse order of the iterated items.
-        # iter_var = list(reversed(iter_var))
-        for item in reversed(iter_var):
-            from copy import deepcopy
+        # Prepare the parts of the configuration which are the same for every item once instead of once per item. The
+        # 'iterate' directive is removed from the skeleton so that the itemized tasks do not iterate again.
+        factories = _get_factories()
 
-            # Create a deep copy of the original task configuration to avoid mangling the original configuration
-            task_configuration = deepcopy(original_task_configuration)
+        class_key = list(original_task_configuration.keys())[0]
+        base_name = original_task_configuration[class_key]['name']
 
-            class_key = list(task_configuration.keys())[0]
+        # Only the values which reference 'item' or 'var' change between items, so everything else is shared with the
+        # skeleton. This is safe because task_from_dict() builds new containers for every configuration it instantiates.
+        skeleton, patches = factories.compile_template({
+            k: v
+            for k, v in original_task_configuration[class_key].items()
+            if k not in ('iterate', 'name')
+        })
 
-            # Remove iterable configuration from the task
-            task_configuration[class_key].pop('iterate')
+        # Items are yielded in their original order; the caller inserts them into the task chain as a single batch.
+        total = len(iter_var)
+        for index, item in enumerate(iter_var, start=1):
+            itemized_configuration = factories.render_compiled_template(skeleton, patches, task_chain=self, item=item)
 
             # Update the task's name
-            task_configuration[class_key]['name'] = f'{task_configuration[class_key]["name"]} - {iter_var.index(item) + 1}/{len(iter_var)}'
-
-            # Template the file with the item
-            from .factories import walk_and_replace
-            itemized_task_configuration = walk_and_replace(obj=task_configuration, task_chain=self, item=item)
+            itemized_configuration['name'] = factories.replace_variable_path_with_value(
+                original_string=f'{base_name} - {index}/{total}',
+                task_chain=self,
+                item=item
+            )
 
-            yield itemized_task_configuration
+            yield {class_key: itemized_configuration}
 
     def terminate(self) -> 'BaseTaskChain':
         """
@@ -1220,47 +1750,66 @@ class BaseTaskChain(List[BaseTask]):
         This method is responsible for updating the job cache with the task chain's progress.
         """
 
-        from ..silos import get_silo
-
         # We only report status to harvest-jobs. If the silo is not available, we return None.
         if not get_silo('harvest-jobs'):
             return None
 
+        def serialize(value: Any) -> str or int or float:
+            """
+            Converts a value into a type Redis accepts as a hash field. Datetimes are stored in ISO format while other
+            values, such as the status counts and unset times, are stored as JSON.
+            """
+
+            if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+                return value
+
+            if isinstance(value, datetime):
+                return value.isoformat()
+
+            return dumps(value, default=str)
+
         def update_task_chain_cache():
             """
             Updates the job cache with the task chain's progress.
             """
+            client = None
+
             while True:
+                # Checked before the entry is built so that the final update always carries the chain's final state
+                finished = self._end_monotonic is not None
+
                 cache_entry = {
-                    'id': self.id,
-                    'status': self.status.__str__(),
-                    'start': self.start,
-                    'end': self.end
-                } | self.detailed_progress()
+                    key: serialize(value)
+                    for key, value in ({
+                        'id': self.id,
+                        'status': self.status.value,
+                        'start': self.start,
+                        'end': self.end
+                    } | self.detailed_progress()).items()
+                }
 
                 try:
-                    client = get_silo('harvest-jobs').connect()
+                    # The client is reused between updates and only replaced after an error
+                    if client is None:
+                        client = get_silo('harvest-jobs').connect()
 
-                    client.hset(name=self.id, mapping=cache_entry)
+                    # Send both commands in a single round trip
+                    pipeline = client.pipeline(transaction=False)
+                    pipeline.hset(name=self.id, mapping=cache_entry)
 
                     # A job which has not updated in 15 minutes is considered stale and will be removed from the cache.
-                    client.expire(name=self.id, time=900)
+                    pipeline.expire(name=self.id, time=900)
+                    pipeline.execute()
 
                 except Exception as ex:
+                    client = None
                     logger.error(f'{self.name}: Error updating job cache: {ex}')
 
                 finally:
-                    from time import sleep
-
-                    match self.status:
-                        case TaskStatusCodes.initialized, TaskStatusCodes.idle:
-                            sleep(5)
-
-                        case TaskStatusCodes.complete:
-                            break
+                    if finished:
+                        break
 
-                        case _:
-                            sleep(1)
+                    self._cache_update_event.wait(timeout=self.CACHE_UPDATE_SECONDS.get(self.status, 1))
 
         thread = Thread(target=update_task_chain_cache, daemon=True)
         thread.start()
@@ -1364,7 +1913,7 @@ class BaseHarvestTaskChain(BaseTaskChain):
             }
         }
 
-        self.task_templates.append(template)
+        self._insert_templates(None, [template])
 
         # Expose the platform, service, type, account, and region as variables
         self.variables['pstar'] = {
@@ -1379,44 +1928,72 @@ class BaseTaskPool:
     """
     The BaseTaskPool class is responsible for managing a pool of tasks that can be executed concurrently. Unlike the
     ThreadPoolExecutor provided by concurrent.futures, the BaseTaskPool class is designed to continue working even if
-    the Pool's queue is empty. This allows for the addition of new tasks to the pool while it is running.
+    the Pool's queue is empty. This allows for the addition of new tasks to the pool while it is running. Tasks are
+    executed on the pool's own ThreadPoolExecutor, so the pool's max_workers limits only its own tasks.
 
     TaskChains should call terminate() on the TaskPool to stop the pool from running once all the Chain's Tasks
     have completed. This will prevent the pool from running indefinitely.
 
     Attributes:
         max_workers (int): The maximum number of concurrent workers.
-        worker_refresh_rate (float): The rate at which the pool checks for task completion and starts new tasks.
-        idle_refresh_rate (float): The rate at which the pool checks for new tasks when idle.
-        _pool (list): The list of tasks waiting to be executed.
-        _active (list): The list of tasks currently being executed.
-        _complete (list): The list of tasks that have completed execution.
+        worker_refresh_rate (float): Retained for compatibility. The pool is notified of new and finished tasks.
+        idle_refresh_rate (float): Retained for compatibility. The pool is notified of new and finished tasks.
+        _pool (deque): The queue of tasks waiting to be executed.
+        _active (dict): The tasks currently being executed, keyed by id().
+        _complete (dict): The most recent tasks that have completed execution, keyed by id().
+        max_complete_history (int): The maximum number of completed tasks retained by the pool.
         _minder_thread (Thread): The thread responsible for managing the task pool.
+        _executor (ThreadPoolExecutor): The executor whose worker threads run the pool's tasks.
         status (TaskStatusCodes): The current status of the task pool.
     """
 
-    def __init__(self, chain: BaseTaskChain, max_workers: int, idle_refresh_rate: float = 3, worker_refresh_rate: float = .5):
+    def __init__(self,
+                 chain: BaseTaskChain,
+                 max_workers: int,
+                 idle_refresh_rate: float = 3,
+                 worker_refresh_rate: float = .5,
+                 max_complete_history: int = 10000):
         """
         Initializes a new instance of the BaseTaskPool class.
 
         Args:
             max_workers (int): The maximum number of concurrent workers.
-            idle_refresh_rate (float, optional): The rate at which the pool checks for new tasks when idle. Defaults to 3 seconds.
-            worker_refresh_rate (float, optional): The rate at which the pool checks for task completion and starts new tasks. Defaults to 0.5 seconds.
+            idle_refresh_rate (float, optional): Retained for compatibility; the pool no longer polls. Defaults to 3 seconds.
+            worker_refresh_rate (float, optional): Retained for compatibility; the pool no longer polls. Defaults to 0.5 seconds.
+            max_complete_history (int, optional): The maximum number of completed tasks retained by the pool. The oldest
+                                                  completed tasks are discarded first. None retains every completed task.
+                                                  Defaults to 10000.
         """
 
         self.chain = chain
         self.max_workers = max_workers
         self.worker_refresh_rate = worker_refresh_rate
         self.idle_refresh_rate = idle_refresh_rate
+        self.max_complete_history = max_complete_history
 
-        self._pool = []         # List of tasks waiting to be executed
-        self._active = []       # List of tasks currently being executed
-        self._complete = []     # List of tasks that have completed execution
+        self._pool = deque()    # Queue of tasks waiting to be executed
+        self._active = {}       # Tasks currently being executed, keyed by id()
+        self._complete = {}     # Tasks that have completed execution, keyed by id()
+
+        # The container (_pool, _active, or _complete) currently holding each task, keyed by id()
+        self._pool_of: Dict[int, deque or dict] = {}
+
+        # Set whenever there are no pending or running tasks. The lock keeps add() and the minder thread from racing
+        # between checking the queue and changing the event.
+        self._idle_event = Event()
+        self._idle_event.set()
+        self._lock = Lock()
+
+        # The minder thread waits on this condition until a task is added, a task finishes, or the pool terminates.
+        # Tasks whose run() method has returned are queued in _finished until the minder thread moves them to _complete.
+        self._condition = Condition(self._lock)
+        self._finished = deque()
 
-        from threading import Thread
         self._minder_thread = Thread(target=self._worker, daemon=True)  # Thread to manage the task pool
 
+        # Worker threads are started by the executor as tasks are submitted and persist until the pool terminates
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='harvest-task')
+
         self.status = TaskStatusCodes.initialized  # Initial status of the task pool
 
     @property
@@ -1435,7 +2012,14 @@ class BaseTaskPool:
             task (BaseTask): The task to be added to the pool.
         """
 
-        self._pool.append(task)
+        # The task is queued and the idle event cleared under the same lock the minder thread holds while it checks
+        # for pending tasks, so the minder can never set the event after it has been cleared for a task it has seen.
+        with self._condition:
+            self._pool_of[id(task)] = self._pool
+            self._pool.append(task)
+            self._idle_event.clear()
+            self._condition.notify()
+
         return self
 
     def wait_until_complete(self, timeout: float = 0) -> 'BaseTaskPool':
@@ -1447,17 +2031,7 @@ class BaseTaskPool:
                                        If 0, the method will wait indefinitely. Defaults to 0.
         """
 
-        from time import sleep
-        from datetime import datetime
-
-        wait_start = datetime.now()
-
-        while self.queue_size > 0:
-            if timeout != 0:
-                if (datetime.now() - wait_start).total_seconds() > timeout:
-                    break
-
-            sleep(1)
+        self._idle_event.wait(timeout=timeout or None)
 
         return self
 
@@ -1469,12 +2043,16 @@ class BaseTaskPool:
             task (BaseTask): The task to be removed from the pool.
         """
 
-        pool = self._find_task(task)
-        try:
-            pool.remove(task)
+        with self._lock:
+            pool = self._pool_of.pop(id(task), None)
+
+            # Only pending tasks are held in the deque; the active and complete tasks are keyed by id(). The minder thread
+            # moves tasks between containers under the same lock, so the recorded container always holds the task.
+            if pool is self._pool:
+                self._pool.remove(task)
 
-        except ValueError:
-            pass  # Task not found in the pool
+            elif pool is not None:
+                pool.pop(id(task), None)
 
         return self
 
@@ -1493,12 +2071,25 @@ class BaseTaskPool:
 
         self.status = TaskStatusCodes.terminating
 
-        # Terminate all tasks in the pool
-        for task in self._pool + self._active:
+        # Wake the minder thread so that it notices the pool is terminating
+        with self._condition:
+            self._condition.notify()
+
+        # Terminate all tasks in the pool. The tasks are copied under the lock because the minder thread may be moving
+        # them between containers.
+        with self._lock:
+            tasks = [*self._pool, *self._active.values()]
+
+        for task in tasks:
             task.terminate()
 
         # Wait for the minder thread to finish
         self._minder_thread.join()
+
+        # Every task has finished once the minder thread exits. The worker threads are not joined because terminate()
+        # may be called by a task running on one of them.
+        self._executor.shutdown(wait=False)
+
         return self
 
     def _worker(self) -> None:
@@ -1506,33 +2097,78 @@ class BaseTaskPool:
         The method run by the minder thread to manage task execution.
         """
 
-        from time import sleep
-        from threading import Thread
-
         self.status = TaskStatusCodes.running
 
         while True:
-            if len(self._active) < self.max_workers and self._pool:
-                next_task = self._pool.pop(0)  # Get the next task from the pool
-                self._active.append(next_task)  # Add the task to the active list
-
-                Thread(target=next_task.run).start()  # Start the task in a new thread
-
-            for task in self._active:
-                if str(task.status) in (str(TaskStatusCodes.complete), str(TaskStatusCodes.error), str(TaskStatusCodes.skipped)):
-                    self._active.remove(task)
-                    self._complete.append(task)
-
-            # Wait before checking the task statuses again
-            if self.queue_size:
-                sleep(self.worker_refresh_rate)
-            else:
-                if str(self.status) == str(TaskStatusCodes.terminating):
-                    break
-                else:
-                    sleep(self.idle_refresh_rate)
+            # Sleep until there is something to do. Every change the minder thread acts on notifies the condition, so
+            # no timeout is needed.
+            with self._condition:
+                self._condition.wait_for(self._has_work)
+
+                # Move the tasks which finished since the last wake to the complete tasks, unless they were removed
+                while self._finished:
+                    task = self._finished.popleft()
+                    if self._active.pop(id(task), None) is not None:
+                        self._complete[id(task)] = task
+                        self._pool_of[id(task)] = self._complete
+
+                # Discard the oldest completed tasks; dicts preserve insertion order
+                if self.max_complete_history is not None:
+                    while len(self._complete) > self.max_complete_history:
+                        oldest = next(iter(self._complete))
+                        del self._complete[oldest]
+                        self._pool_of.pop(oldest, None)
+
+                # Move as many pending tasks as there are free slots to the active tasks. This happens under the lock so
+                # that remove() always finds a task in the container recorded for it.
+                starting = []
+                while self._pool and len(self._active) < self.max_workers:
+                    next_task = self._pool.popleft()
+                    self._active[id(next_task)] = next_task
+                    self._pool_of[id(next_task)] = self._active
+                    starting.append(next_task)
+
+                # Signal any waiters once there are no pending or running tasks
+                if not self._active and not self._pool:
+                    self._idle_event.set()
+
+            # Tasks are submitted outside the lock because a task which has already finished calls
+            # _on_task_finished() immediately, and that method acquires the lock.
+            for next_task in starting:
+                # Run the task on a worker thread and wake the minder thread once it returns
+                self._executor.submit(next_task.run).add_done_callback(
+                    lambda future, task=next_task: self._on_task_finished(task)
+                )
+
+            if not self.queue_size and self.status is TaskStatusCodes.terminating:
+                break
+
+    def _has_work(self) -> bool:
+        """
+        Returns True when the minder thread has work to do: a task can be started, a task has finished, or the pool is
+        terminating with no tasks left. Must be called while holding the condition.
+        """
+
+        return bool(
+            (self._pool and len(self._active) < self.max_workers)
+            or self._finished
+            or (self.status is TaskStatusCodes.terminating and not self.queue_size)
+        )
+
+    def _on_task_finished(self, task: BaseTask) -> None:
+        """
+        Called by the executor when a task's run() method returns. Queues the task and wakes the minder thread so the
+        task can be moved to the complete tasks and the next task started.
 
-    def _find_task(self, task: BaseTask) -> list:
+        Args:
+            task (BaseTask): The task which finished.
+        """
+
+        with self._condition:
+            self._finished.append(task)
+            self._condition.notify()
+
+    def _find_task(self, task: BaseTask) -> deque or dict:
         """
         Finds the pool (waiting, active, or complete) that contains the given task.
 
@@ -1540,14 +2176,10 @@ class BaseTaskPool:
             task (BaseTask): The task to find.
 
         Returns:
-            list: The pool that contains the task.
+            deque or dict: The pool that contains the task.
         """
 
-        for pool in [self._pool, self._active, self._complete]:
-            if task in pool:
-                return pool
-
-        return []
+        return self._pool_of.get(id(task), {})
 
 
 class BaseHarvestException(BaseException):
@@ -1558,7 +2190,10 @@ class BaseHarvestException(BaseException):
     def __init__(self, *args, log_level: _log_levels = 'error'):
         super().__init__(*args)
 
-        getattr(logger, log_level.lower())(str(args))
+        # The message is only formatted when the level is enabled
+        level = _LOG_LEVEL_NUMBERS[log_level.lower()]
+        if logger.isEnabledFor(level):
+            logger.log(level, '%s', args)
 
 
 class BaseTaskException(BaseHarvestException):
@@ -1,8 +1,9 @@
 """
 factories.py - This module contains functions for creating task chains from files or dictionaries.
 """
+from copy import copy
 from logging import getLogger
-from typing import Any
+from typing import Any, List, Tuple
 from .base import BaseTaskChain, BaseTask
 
 logger = getLogger('harvest')
@@ -383,3 +384,70 @@ def walk_and_replace(obj: Any, **kwargs) -> Any:
 
     else:
         return obj
+
+
+def compile_template(obj: Any) -> Tuple[Any, List[Tuple[tuple, str]]]:
+    """
+    Walks through a nested list of dictionaries and lists once, recording the path to every string which references an
+    'item' or 'var' variable. Objects which are templated repeatedly, such as iterated task configurations, can then be
+    rendered with render_compiled_template() without walking the entire object each time.
+
+    Args:
+        obj (Any): The object to compile.
+
+    Returns:
+        A tuple of the object itself, used as the skeleton, and a list of (path, template string) tuples.
+    """
+
+    patches = []
+
+    def find_patches(o: Any, path: tuple):
+        if isinstance(o, dict):
+            for k, v in o.items():
+                find_patches(v, path + (k,))
+
+        elif isinstance(o, list):
+            for i, v in enumerate(o):
+                find_patches(v, path + (i,))
+
+        elif isinstance(o, str) and any([f'{prefix}.' in o for prefix in ('item', 'var')]):
+            patches.append((path, o))
+
+    find_patches(obj, ())
+
+    return obj, patches
+
+
+def render_compiled_template(skeleton: Any, patches: List[Tuple[tuple, str]], **kwargs) -> Any:
+    """
+    Renders an object compiled by compile_template(), executing replace_variable_path_with_value() for each patch. Only
+    the containers along each patch's path are copied; all other values are shared with the skeleton.
+
+    Args:
+        skeleton (Any): The skeleton returned by compile_template().
+        patches (List[Tuple[tuple, str]]): The patches returned by compile_template().
+        **kwargs: Keyword arguments to pass to replace_variable_path_with_value().
+
+    Returns:
+        The rendered object.
+    """
+
+    # The skeleton itself is a template string
+    if patches and patches[0][0] == ():
+        return replace_variable_path_with_value(original_string=patches[0][1], **kwargs)
+
+    result = copy(skeleton)
+    copied = set()
+
+    for path, template in patches:
+        parent = result
+        for depth, key in enumerate(path[:-1], start=1):
+            if path[:depth] not in copied:
+                parent[key] = copy(parent[key])
+                copied.add(path[:depth])
+
+            parent = parent[key]
+
+        parent[path[-1]] = replace_variable_path_with_value(original_string=template, **kwargs)
+
+    return result
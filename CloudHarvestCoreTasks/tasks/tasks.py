@@ -11,6 +11,7 @@ a method() function that performs the task's operation. The method() function sh
 
 from CloudHarvestCorePluginManager.decorators import register_definition
 from logging import getLogger
+from time import sleep
 from typing import Any, List, Literal
 
 from pymongo import MongoClient
@@ -19,7 +20,8 @@ from .base import (
     BaseDataTask,
     BaseTask,
     BaseTaskChain,
-    TaskStatusCodes
+    TaskStatusCodes,
+    TERMINAL_STATUS_CODES
 )
 from .exceptions import *
 
@@ -34,6 +36,8 @@ class DummyTask(BaseTask):
     Task class. It represents a task that does nothing when run. Used for testing.
     """
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         """
         Initializes a new instance of the DummyTask class.
@@ -60,6 +64,9 @@ class ErrorTask(BaseTask):
     This task is used for testing error handling in task chains and should not be used in production code. For example,
     this task is used for testing the `on: error` directive in task chain configurations.
     """
+
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -79,6 +86,15 @@ class FileTask(BaseTask):
         method(): Performs the file operation specified by the mode and format attributes.
     """
 
+    __slots__ = (
+        'path',
+        'abs_path',
+        'mode',
+        'format',
+        'desired_keys',
+        'template',
+    )
+
     def __init__(self,
                  path: str,
                  mode: Literal['append', 'read', 'write'],
@@ -286,7 +302,7 @@ class HarvestRecordSetTask(BaseTask):
         method(): Executes the function on the record set with the provided arguments and stores the result in the data attribute.
     """
 
-
+    __slots__ = ('stages', 'stage_position')
 
     def __init__(self, data: Any, stages: List[dict], *args, **kwargs):
         """
@@ -357,6 +373,8 @@ class HarvestRecordSetTask(BaseTask):
 
 @register_definition(name='prune', category='task')
 class PruneTask(BaseTask):
+    __slots__ = ('previous_task_data', 'stored_variables')
+
     def __init__(self, previous_task_data: bool = False, stored_variables: bool = False, *args, **kwargs):
         """
         Prunes the task chain.
@@ -383,7 +401,7 @@ class PruneTask(BaseTask):
         # If previous_task_data is True, clear the data of all previous tasks
         if self.previous_task_data:
             for i in range(self.task_chain.position):
-                if str(self.task_chain[i].status) in [str(TaskStatusCodes.complete), str(TaskStatusCodes.error), str(TaskStatusCodes.skipped)]:
+                if self.task_chain[i].status in TERMINAL_STATUS_CODES:
                     total_bytes_pruned += getsizeof(self.task_chain[i].result)
                     self.task_chain[i].result = None
 
@@ -405,6 +423,8 @@ class HarvestUpdateTask(BaseTask):
     to upload data collected in a BaseHarvestTaskChain to a MongoDB database.
     """
 
+    __slots__ = ()
+
     REQUIRED_METADATA_FIELDS = (
         'Platform',                     # The Platform (ie AWS, Azure, Google)
         'Service',                      # The Platform's service name (ie RDS, EC2, GCP)
@@ -493,9 +513,10 @@ class HarvestUpdateTask(BaseTask):
             metadata (dict): The metadata to attach to the records.
         """
 
+        from ..helpers import get_nested_values
+
         for record in data:
             # Generate this record's unique filter
-            from helpers import get_nested_values
             unique_identifier = '-'.join([get_nested_values(s=field, d=record)[0] for field in metadata['UniqueIdentifierKeys']])
 
             # Attach existing metadata to the record
@@ -573,14 +594,15 @@ class HarvestUpdateTask(BaseTask):
         replacements = []
         metadata =[]
 
+        from bson import ObjectId
         from datetime import datetime, timezone
         from pymongo import ReplaceOne
+        from ..helpers import get_nested_values
         from ..silos import get_silo
 
         for record in data:
             # Remove an existing MongoDb _id field if it exists. This happens if the data source is MongoDB. We don't
             # want to set the _id field because it is the primary key in MongoDB which should not be overwritten by this process.
-            from bson import ObjectId
             if isinstance(record.get('_id'), ObjectId):
                 record.pop('_id')
 
@@ -591,7 +613,6 @@ class HarvestUpdateTask(BaseTask):
                                           upsert=True)
 
             # Gather the extra metadata fields for the record
-            from helpers import get_nested_values
             extras = {
                 field: get_nested_values(s=field, d=record)
                 for field in self.task_chain.extra_metadata_fields
@@ -754,6 +775,8 @@ class HarvestUpdateTask(BaseTask):
 
 @register_definition(name='json', category='task')
 class JsonTask(BaseTask):
+    __slots__ = ('mode', 'default_type', 'parse_datetimes')
+
     def __init__(self, mode: Literal['serialize', 'deserialize'], data: Any = None, default_type: type = str,
                  parse_datetimes: bool = False, *args, **kwargs):
         """
@@ -839,12 +862,28 @@ class MongoTask(BaseDataTask):
     """
     The MongoTask class is a subclass of the BaseDataTask class. It represents a task that interacts with a MongoDB database.
     """
+
+    __slots__ = ('collection', 'result_attribute')
+
     from ..user_filters import MongoUserFilter
 
     # The user filter class and stage are used to apply user filters to the database query results.
     USER_FILTER_CLASS = MongoUserFilter
     USER_FILTER_STAGE = 'start'
 
+    # Commands whose results may be cached when `cache_ttl` is set
+    READ_ONLY_COMMANDS = frozenset({
+        'aggregate',
+        'count_documents',
+        'distinct',
+        'estimated_document_count',
+        'find',
+        'find_one',
+        'index_information',
+        'list_collection_names',
+        'list_indexes',
+    })
+
     def __init__(self, collection: str = None, result_attribute: str = None, *args, **kwargs):
         """
         Initializes a new instance of the MongoTask class.
@@ -860,6 +899,27 @@ class MongoTask(BaseDataTask):
         self.collection = collection
         self.result_attribute = result_attribute
 
+    def is_read_only(self) -> bool:
+        """
+        Returns True when the command does not write to the database. Aggregation pipelines which end in a $out or
+        $merge stage write their results to a collection and are not read-only.
+        """
+
+        if not super().is_read_only():
+            return False
+
+        if self.base_command_part == 'aggregate':
+            return not any('$out' in stage or '$merge' in stage for stage in self.arguments.get('pipeline') or ())
+
+        return True
+
+    def cache_key_parts(self) -> tuple:
+        """
+        Adds the collection and result attribute to the values which identify the task's result in the result cache.
+        """
+
+        return super().cache_key_parts() + (self.collection, self.result_attribute)
+
     def is_connected(self) -> bool:
         """
         Checks if the task is connected to the database.
@@ -867,17 +927,8 @@ class MongoTask(BaseDataTask):
         Returns:
             bool: True if the task is connected to the database, otherwise False.
         """
-        from pymongo import MongoClient
-        silo_config = self.silo.__dict__()
-        silo_config.pop('engine')
-        silo_config.pop('database')
 
-        silo_extend = silo_config.pop('extended_db_configuration', {})
-        connection_config = silo_config | silo_extend
-        client = MongoClient(**connection_config)
-        si = client.server_info()
-
-        return True
+        return self.silo.is_connected
 
     def apply_user_filters(self) -> 'BaseTask':
         """
@@ -903,19 +954,8 @@ class MongoTask(BaseDataTask):
         from the result, if applicable.
         """
 
-        # If connected, return existing connection otherwise connect
-        from pymongo import MongoClient
-        silo_config = self.silo.__dict__()
-        silo_config.pop('engine')
-        silo_config.pop('database')
-
-        silo_extend = silo_config.pop('extended_db_configuration', {})
-        connection_config = silo_config | silo_extend
-        client = MongoClient(**connection_config)
-        si = client.server_info()
-
-        if not self.silo.is_connected:
-            raise ConnectionError(f'{self.name}: Unable to connect to the {self.silo.name} silo.')
+        # Use the silo's connection pool; the silo raises a ConnectionError if it is unable to connect
+        client = self.silo.connect()
 
         if self.collection:
             # Note that MongoDb does not return an error if a collection is not found. Instead, MongoDb will faithfully
@@ -926,18 +966,26 @@ class MongoTask(BaseDataTask):
             # Expose database-level commands
             database_object = client[self.silo.database]
 
-        # Execute the command on the database or collection
-        self.calls += 1
-
-        result = self.walk_result_command_path(
-            getattr(database_object, self.base_command_part)(**self.arguments)
-        )
-
-        # Convert the result to a list if it is a generator or cursor
         from types import GeneratorType
         from pymongo import CursorType
         from pymongo.cursor import Cursor
 
+        def execute():
+            # Execute the command on the database or collection
+            self.calls += 1
+
+            result = getattr(database_object, self.base_command_part)(**self.arguments)
+
+            # Convert the result to a list so that it can be cached, unless the command path reads from the cursor itself
+            if self.base_command_part == self.command and isinstance(result, (GeneratorType, CursorType, Cursor)):
+                result = list(result)
+
+            return result
+
+        # The command path is walked on cached results too, so a cached result is handled the same way as a new one
+        result = self.walk_result_command_path(self.cached_result(execute))
+
+        # Convert the result to a list if it is a generator or cursor
         if isinstance(result, (GeneratorType, CursorType, Cursor)):
             result = list(result)
 
@@ -961,6 +1009,8 @@ class RedisTask(BaseDataTask):
     >>> )
     """
 
+    __slots__ = ('expire', 'serialization')
+
     from redis import StrictRedis
 
     # These are the data types permitted in Redis. We use this list to evaluate if a value must be serialized before
@@ -1169,7 +1219,7 @@ class RedisTask(BaseDataTask):
                     r = loads(r)
 
             except Exception as ex:
-                self.meta['Errors'].append(f"Error retrieving key '{n}': {str(ex)}")
+                self._record_error(ex, f"Error retrieving key '{n}': {str(ex)}")
 
             else:
                 return {n: r}
@@ -1422,7 +1472,7 @@ class RedisTask(BaseDataTask):
                 raise ValueError("Invalid arguments provided. Must provide 'name' and 'value' or 'name' and 'keys'.")
 
         except Exception as ex:
-            self.meta['Errors'].append(str(ex))
+            self._record_error(ex)
 
         return results
 
@@ -1458,6 +1508,15 @@ class RedisTask(BaseDataTask):
 
 @register_definition(name='wait', category='task')
 class WaitTask(BaseTask):
+    __slots__ = (
+        'check_time_seconds',
+        '_when_after_seconds',
+        '_when_all_previous_async_tasks_complete',
+        '_when_all_previous_tasks_complete',
+        '_when_all_tasks_by_name_complete',
+        '_when_any_tasks_by_name_complete',
+    )
+
     def __init__(self,
                  check_time_seconds: float = 1,
                  when_after_seconds: float = 0,
@@ -1495,33 +1554,49 @@ class WaitTask(BaseTask):
         """
         Runs the task. This method will block until the conditions specified by the task attributes are met.
         """
-        from time import sleep
-
-        while True:
-            if any([
-                self.when_after_seconds,
-                self.when_all_previous_async_tasks_complete,
-                self.when_all_previous_tasks_complete,
-                self.when_all_tasks_by_name_complete,
-                self.when_any_tasks_by_name_complete,
-                self.status == TaskStatusCodes.terminating
-            ]):
-                break
 
-            sleep(self.check_time_seconds)
+        while not any([
+            self.when_after_seconds,
+            self.when_all_previous_async_tasks_complete,
+            self.when_all_previous_tasks_complete,
+            self.when_all_tasks_by_name_complete,
+            self.when_any_tasks_by_name_complete,
+            self.status is TaskStatusCodes.terminating
+        ]):
+            self._wait_for_next_event()
+
+    def _wait_for_next_event(self):
+        """
+        Blocks until the next previous task in the chain reaches a final state, the `when_after_seconds` deadline is
+        reached, or `check_time_seconds` elapses, whichever comes first. This allows the WaitTask to wake up as soon as
+        one of its conditions could have changed rather than sleeping for a full `check_time_seconds` interval.
+        """
+
+        timeout = self.check_time_seconds
+
+        # Do not wait past the `when_after_seconds` deadline
+        if self._when_after_seconds > 0 and self.duration >= 0:
+            remaining = self._when_after_seconds - self.duration
+            timeout = max(min(timeout, remaining), 0)
+
+        if self.task_chain:
+            for task in self.task_chain[0:self.position]:
+                if not task.done_event.is_set():
+                    task.done_event.wait(timeout)
+                    return
+
+        sleep(timeout)
 
     @property
     def when_after_seconds(self) -> bool:
         """
         Checks if the allotted seconds have passed since this Task started. This method requires that super.on_start()
-        is run at, at the least, that `self.start` is populated with a UTC datetime object.
+        is run so that the Task's duration can be measured.
         """
 
-        from datetime import datetime, timezone
-
         if self._when_after_seconds > 0:
-            if isinstance(self.start, datetime):
-                return  (datetime.now(tz=timezone.utc) - self.start).total_seconds() > self._when_after_seconds
+            if self.duration >= 0:
+                return self.duration > self._when_after_seconds
 
     @property
     def when_all_previous_async_tasks_complete(self) -> bool:
@@ -1591,5 +1666,5 @@ class WaitTask(BaseTask):
                     TaskStatusCodes.complete, TaskStatusCodes.error
                 ]
                 for task in self.task_chain[0:self.position]
-                if task.name in self._when_all_tasks_by_name_complete
+                if task.name in self._when_any_tasks_by_name_complete
             ])
@@ -8,6 +8,31 @@ from typing import Any
 from logging import getLogger
 logger = getLogger('harvest')
 
+# The Jinja2 environment is shared by all templates and is created on first use by get_environment()
+_ENVIRONMENT = None
+
+
+def get_environment():
+    """
+    Returns the shared Jinja2 environment, creating it on first use. All filters from `list_filters()` are added to the
+    environment when it is created.
+
+    Returns:
+        Environment: The shared Jinja2 environment.
+    """
+
+    global _ENVIRONMENT
+
+    if _ENVIRONMENT is None:
+        from jinja2 import Environment
+
+        environment = Environment()
+        environment.filters.update(list_filters())
+
+        _ENVIRONMENT = environment
+
+    return _ENVIRONMENT
+
 
 def template_object(template: Any, variables: dict = None) -> dict:
     """
@@ -30,8 +55,6 @@ def template_object(template: Any, variables: dict = None) -> dict:
     """
     result = {}
 
-    from jinja2 import Environment, DictLoader
-
     # If the template is not a string, convert it to a JSON string
     if not isinstance(template, str):
         from json import dumps
@@ -39,18 +62,10 @@ def template_object(template: Any, variables: dict = None) -> dict:
     else:
         template_to_render = template
 
-    # Create a Jinja2 environment with the template
-    environment = Environment(
-        loader=DictLoader({'template': template_to_render}),
-    )
-
-    # Add all filters from the `filters` module to the environment
-    environment.filters.update(list_filters())
-
     try:
         # Render the template with the provided variables (or an empty dictionary if no variables were provided)
         from json import loads
-        rendered = environment.get_template('template').render(**variables or {})
+        rendered = get_environment().from_string(template_to_render).render(**variables or {})
         result = loads(rendered)
 
     except Exception as e:
@@ -4,7 +4,11 @@ This module contains tests the "tasks.factories" module.
 
 import unittest
 from ..CloudHarvestCoreTasks.tasks import BaseTaskChain
-from ..CloudHarvestCoreTasks.tasks.factories import replace_variable_path_with_value
+from ..CloudHarvestCoreTasks.tasks.factories import (
+    compile_template,
+    render_compiled_template,
+    replace_variable_path_with_value
+)
 
 class TestReplaceVariablePathWithValue(unittest.TestCase):
     def setUp(self):
@@ -132,3 +136,27 @@ class TestReplaceVariablePathWithValue(unittest.TestCase):
         self.assertEqual(replace_variable_path_with_value(original_string='var.replace_test.test_nested_dict.keys[0].upper.__len__',
                                                           task_chain=self.task_chain),
                          4)
+
+
+class TestCompileTemplate(unittest.TestCase):
+    def test_render_compiled_template(self):
+        template = {
+            'name': 'item.name',
+            'static': {'key': 'value'},
+            'nested': {'values': ['static', 'My age is item.age']}
+        }
+
+        skeleton, patches = compile_template(template)
+
+        # Only the strings which reference a variable are patched
+        self.assertEqual(sorted(path for path, _ in patches), [('name',), ('nested', 'values', 1)])
+
+        for item in ({'name': 'John', 'age': 45}, {'name': 'Jane', 'age': 47}):
+            result = render_compiled_template(skeleton, patches, item=item)
+
+            self.assertEqual(result['name'], item['name'])
+            self.assertEqual(result['nested']['values'], ['static', f"My age is {item['age']}"])
+
+            # Values without variables are shared with the skeleton, which is never modified
+            self.assertIs(result['static'], template['static'])
+            self.assertEqual(template['nested']['values'][1], 'My age is item.age')
@@ -79,6 +79,23 @@ class TestBaseTask(BaseTestCase):
         self.assertEqual(self.base_task.description, 'test task')
         self.assertEqual(str(str(self.base_task.status)), str(TaskStatusCodes.initialized))
 
+    def test_user_filters(self):
+        # Test that user filters take precedence over task chain filters which take precedence over the defaults
+        from ..CloudHarvestCoreTasks.tasks.factories import task_chain_from_dict
+        task_chain = task_chain_from_dict(template={
+            'chain': {
+                'name': 'test_chain',
+                'tasks': [],
+                'user_filters': {'limit': 5, 'sort': ['keyA']}
+            }
+        })
+
+        task = DummyTask(name='test', task_chain=task_chain, user_filters={'limit': 10})
+
+        self.assertEqual(task.user_filters['limit'], 10)
+        self.assertEqual(task.user_filters['sort'], ['keyA'])
+        self.assertEqual(task.user_filters['count'], False)
+
     def test_run(self):
         # Test the run method
         self.base_task.run()
@@ -98,6 +115,22 @@ class TestBaseTask(BaseTestCase):
             
         self.assertEqual(str(self.base_task.status), str(TaskStatusCodes.error))
 
+        # Failed tasks record their end time like completed tasks
+        self.assertIsNotNone(self.base_task.end)
+        self.assertTrue(self.base_task.done_event.is_set())
+
+        # Errors are recorded as strings so that the task's metadata can be serialized
+        from json import dumps
+        self.assertEqual(self.base_task.errors, ['Exception: Test exception'])
+        self.assertIn('Exception: Test exception', dumps(self.base_task.meta))
+
+        # Only the most recent errors are kept
+        for i in range(self.base_task.MAX_ERRORS + 5):
+            self.base_task.on_error(ValueError(f'error {i}'))
+
+        self.assertEqual(len(self.base_task.errors), self.base_task.MAX_ERRORS)
+        self.assertEqual(self.base_task.errors[-1], f'ValueError: error {self.base_task.MAX_ERRORS + 4}')
+
     def test_retry(self):
         # Test the retry method
         from ..CloudHarvestCoreTasks.tasks.base import BaseTaskChain
@@ -184,6 +217,124 @@ class TestBaseTask(BaseTestCase):
         self.assertEqual(str(task_chain[4].status), str(TaskStatusCodes.error))
         self.assertEqual(task_chain[4].attempts, 1)
 
+    def test_retry_patterns_follow_retry(self):
+        # Patterns assigned after the task is created replace the patterns it was created with
+        task = ErrorTask(name='error_task', retry={'max_attempts': 3, 'delay_seconds': .001, 'when_error_like': 'derp'})
+        task.retry = {'max_attempts': 3, 'delay_seconds': .001, 'when_error_like': 'This is an error task'}
+        task.run()
+        self.assertEqual(task.attempts, 3)
+
+        task = ErrorTask(name='error_task', retry={'max_attempts': 3, 'delay_seconds': .001})
+        task.retry = {'max_attempts': 3, 'delay_seconds': .001, 'when_error_not_like': 'This is an error task'}
+        task.run()
+        self.assertEqual(task.attempts, 1)
+
+    def test_retry_delay(self):
+        # The fixed backoff always waits delay_seconds
+        self.base_task.retry = {'delay_seconds': 2}
+        self.base_task.attempts = 5
+        self.assertEqual(self.base_task._retry_delay(), 2)
+
+        # The jitter backoff waits up to delay_seconds doubled for each previous attempt, capped at max_delay_seconds
+        self.base_task.retry = {'backoff': 'jitter', 'delay_seconds': 2, 'max_delay_seconds': 10}
+        for attempts, ceiling in ((1, 2), (2, 4), (3, 8), (4, 10), (10, 10)):
+            self.base_task.attempts = attempts
+            self.assertTrue(0 <= self.base_task._retry_delay() <= ceiling)
+
+    def test_cached_result(self):
+        from types import SimpleNamespace
+
+        # The cache key only needs the silo's name, so no connection is made
+        silo = SimpleNamespace(name='test_cache_silo')
+        calls = []
+
+        def execute():
+            calls.append(1)
+            return [{'a': 1}]
+
+        def mongo_task(**kwargs):
+            task = MongoTask(**{'name': 'test', 'command': 'find', 'silo': None, 'collection': 'users',
+                                'arguments': {'filter': {'a': 1}}} | kwargs)
+            task.silo = silo
+            return task
+
+        # Without a cache_ttl every call reaches the data provider
+        task = mongo_task()
+        task.cached_result(execute)
+        task.cached_result(execute)
+        self.assertEqual(len(calls), 2)
+
+        # Identical commands reuse the cached result while it has not expired
+        calls.clear()
+        task = mongo_task(cache_ttl=60)
+        self.assertEqual(task.cached_result(execute), [{'a': 1}])
+        self.assertEqual(mongo_task(cache_ttl=60).cached_result(execute), [{'a': 1}])
+        self.assertEqual(len(calls), 1)
+
+        # Each hit is a copy, so changing one result does not change the cached result
+        mongo_task(cache_ttl=60).cached_result(execute)[0]['a'] = 2
+        self.assertEqual(mongo_task(cache_ttl=60).cached_result(execute), [{'a': 1}])
+        self.assertEqual(len(calls), 1)
+
+        # Different arguments and collections are cached separately
+        mongo_task(cache_ttl=60, arguments={'filter': {'a': 2}}).cached_result(execute)
+        mongo_task(cache_ttl=60, collection='orders').cached_result(execute)
+        self.assertEqual(len(calls), 3)
+
+        # Commands which write to the database are never cached
+        calls.clear()
+        for _ in range(2):
+            mongo_task(cache_ttl=60, command='delete_many').cached_result(execute)
+            mongo_task(cache_ttl=60, command='aggregate', arguments={'pipeline': [{'$out': 'copy'}]}).cached_result(execute)
+
+        self.assertEqual(len(calls), 4)
+
+    def test_cached_result_walks_command_path(self):
+        from types import SimpleNamespace
+        from ..CloudHarvestCoreTasks.tasks.base import BaseTaskChain
+
+        calls = []
+
+        def find_one(**kwargs):
+            calls.append(1)
+            return {'name': 'alice', 'email': 'alice@example.com'}
+
+        # The silo's client is a mapping of databases to collections, so no connection is made
+        silo = SimpleNamespace(name='test_walk_silo', database='test',
+                               connect=lambda: {'test': {'users': SimpleNamespace(find_one=find_one)}})
+        chain = BaseTaskChain(template={'name': 'test_chain', 'tasks': []})
+
+        def run(command, result_as):
+            task = MongoTask(name='test', command=command, silo=None, collection='users', cache_ttl=60,
+                             arguments={'filter': {'name': 'alice'}}, result_as=result_as, task_chain=chain)
+            task.silo = silo
+            chain.append(task)
+            return task.run()
+
+        # The second read is served from the cache, and its command path is still walked into the chain's variables
+        for _ in range(2):
+            run('find_one.name', 'user_name')
+            self.assertEqual(chain.variables['user_name'], 'alice')
+
+        run('find_one.email', 'user_email')
+        self.assertEqual(chain.variables['user_email'], 'alice@example.com')
+        self.assertNotIn('find_one', chain.variables)
+        self.assertEqual(len(calls), 1)
+
+    def test_measure_result(self):
+        from sys import getsizeof
+
+        # The estimate includes the records in the result, not only the list holding them
+        self.base_task.result = [{'key': 'value' * 10} for _ in range(500)]
+        self.base_task._measure_result()
+        self.assertEqual(self.base_task._result_records, 500)
+        self.assertGreater(self.base_task._result_bytes, getsizeof(self.base_task.result) * 10)
+
+        # Replacing the result, as PruneTask does, discards the previous measurements
+        self.base_task.result = None
+        self.assertIsNone(self.base_task._result_bytes)
+        self.assertIsNone(self.base_task._result_records)
+
     def test_on_skipped(self):
         self.base_task.on_skipped()
         self.assertEqual(str(self.base_task.status), str(str(TaskStatusCodes.skipped)))
@@ -355,6 +506,11 @@ class TestBaseTaskChain(BaseTestCase):
         # Assert that the status of the task chain is 'error'
         self.assertEqual(str(str(self.base_task_chain.status)), str(TaskStatusCodes.error))
 
+        # run() always finishes with on_complete(), which must not mask the error
+        self.base_task_chain.on_complete()
+        self.assertEqual(str(self.base_task_chain.status), str(TaskStatusCodes.error))
+        self.assertIsNotNone(self.base_task_chain.end)
+
     def test_terminate(self):
         """
         Test the terminate method of the BaseTaskChain class.
@@ -364,6 +520,36 @@ class TestBaseTaskChain(BaseTestCase):
         # Assert that the status of the task chain is 'terminating'
         self.assertEqual(str(str(self.base_task_chain.status)), str(TaskStatusCodes.terminating))
 
+    def test_detailed_progress(self):
+        """
+        Test that the detailed_progress status counts match the statuses of the tasks in the chain.
+        """
+        self.base_task_chain.run()
+        counts = self.base_task_chain.detailed_progress()['counts']
+
+        self.assertEqual(counts[TaskStatusCodes.complete.value], 3)
+        self.assertEqual(sum(counts.values()), len(self.base_task_chain))
+
+        for code in TaskStatusCodes:
+            self.assertEqual(counts[code.value], len([task for task in self.base_task_chain if task.status is code]))
+
+        # A chain without any tasks reports no progress instead of dividing by zero
+        empty_chain = task_chain_from_dict(template={'chain': {'name': 'empty_chain', 'tasks': []}})
+        self.assertEqual(empty_chain.detailed_progress()['percent'], 0)
+
+    def test_find_task_position_by_name(self):
+        """
+        Test the find_task_position_by_name method of the BaseTaskChain class.
+        """
+        self.assertEqual(self.base_task_chain.find_task_position_by_name('dummy_task'), 0)
+        self.assertEqual(self.base_task_chain.find_task_position_by_name('wait_task'), 1)
+        self.assertIsNone(self.base_task_chain.find_task_position_by_name('missing_task'))
+
+        # Inserting a task shifts the positions of the tasks which follow it
+        self.base_task_chain.insert_task_after_name('dummy_task', {'dummy': {'name': 'inserted_task'}})
+        self.assertEqual(self.base_task_chain.find_task_position_by_name('inserted_task'), 1)
+        self.assertEqual(self.base_task_chain.find_task_position_by_name('wait_task'), 2)
+
     def test_performance_metrics(self):
         """
         Test the performance_metric method of the BaseTaskChain class.
@@ -376,6 +562,7 @@ class TestBaseTaskChain(BaseTestCase):
         # Assert that the report contains the expected keys
         self.assertEqual(report[0]['data'][-2]['Position'], '')
         self.assertEqual(report[0]['data'][-1]['Position'], 'Total')
+        self.assertEqual(report[0]['meta']['headers'], list(BaseTaskChain.PERFORMANCE_METRICS_HEADERS))
 
 class TestBaseTaskChainIterateDirective(BaseTestCase):
     def setUp(self):
@@ -406,6 +593,7 @@ class TestBaseTaskChainIterateDirective(BaseTestCase):
 
         self.assertEqual(len(self.task_chain), 4)
         self.assertEqual(str(self.task_chain[0].status), str(TaskStatusCodes.skipped))  # This was the parent task
+        self.assertTrue(self.task_chain[0].done_event.is_set())  # Tasks waiting on the parent are released
         self.assertEqual(str(self.task_chain[1].status), str(TaskStatusCodes.complete))
         self.assertEqual(str(self.task_chain[2].status), str(TaskStatusCodes.complete))
         self.assertEqual(str(self.task_chain[3].status), str(TaskStatusCodes.complete))
@@ -420,6 +608,27 @@ class TestBaseTaskChainIterateDirective(BaseTestCase):
         self.assertEqual(self.task_chain[2].description, 'test_2')
         self.assertEqual(self.task_chain[3].description, 'test_3')
 
+    def test_iterative_run_preserves_order(self):
+        self.task_configuration['chain']['tasks'].append({
+            'dummy': {
+                'name': 'Dummy Following Task',
+                'description': 'This task runs after the iterated tasks.'
+            }
+        })
+
+        task_chain = task_chain_from_dict(task_chain_registered_class_name='report', template=self.task_configuration)
+        task_chain.variables['iterate_test'] = ['test_1', 'test_2', 'test_3', 'test_4', 'test_5']
+        task_chain.run()
+
+        self.assertEqual(len(task_chain), 7)
+
+        # The iterated tasks are inserted in the order of the iterated variable and ahead of the following task
+        self.assertEqual([task.description for task in task_chain[1:6]],
+                         ['test_1', 'test_2', 'test_3', 'test_4', 'test_5'])
+        self.assertEqual([task.name for task in task_chain[1:6]],
+                         [f'Dummy Iterative Task - {i}/5' for i in range(1, 6)])
+        self.assertEqual(task_chain[6].name, 'Dummy Following Task')
+
 class TestBaseTaskChainOnDirective(BaseTestCase):
     def setUp(self):
         """
@@ -623,6 +832,56 @@ class TestBaseTaskPool(BaseTestCase):
             self.assertEqual(str(task.status), str(TaskStatusCodes.complete)) for task in self.base_task_chain
         ]
 
+    def test_add_remove_and_wait(self):
+        from ..CloudHarvestCoreTasks.tasks.base import BaseTaskPool
+
+        pool = BaseTaskPool(chain=self.base_task_chain, max_workers=2)
+
+        # A pending task can be removed before the pool starts it
+        removed = DummyTask(name='removed task')
+        pool.add(removed)
+        pool.remove(removed)
+        self.assertEqual(pool.queue_size, 0)
+        self.assertEqual(pool._find_task(removed), {})
+
+        # Waiters are released once every task added to a started pool has finished
+        tasks = [DummyTask(name=f'pooled task {i}') for i in range(5)]
+        pool.start()
+
+        for task in tasks:
+            pool.add(task)
+
+        pool.wait_until_complete(timeout=5)
+        self.assertEqual(pool.queue_size, 0)
+        self.assertTrue(all(pool._find_task(task) is pool._complete for task in tasks))
+
+        pool.terminate()
+
+    def test_pools_do_not_share_workers(self):
+        from ..CloudHarvestCoreTasks.tasks.base import BaseTaskPool
+
+        busy_pool = BaseTaskPool(chain=self.base_task_chain, max_workers=1).start()
+        free_pool = BaseTaskPool(chain=self.base_task_chain, max_workers=1).start()
+        self.assertIsNot(busy_pool._executor, free_pool._executor)
+
+        # A task in one pool does not wait for a worker held by another pool with the same max_workers
+        waiting = WaitTask(name='busy pool task', when_after_seconds=2)
+        busy_pool.add(waiting)
+
+        quick = DummyTask(name='free pool task')
+        free_pool.add(quick).wait_until_complete(timeout=1)
+        self.assertEqual(quick.status, TaskStatusCodes.complete)
+        self.assertEqual(waiting.status, TaskStatusCodes.running)
+
+        busy_pool.wait_until_complete(timeout=5)
+        self.assertEqual(waiting.status, TaskStatusCodes.complete)
+
+        # Terminating a pool shuts down its executor
+        busy_pool.terminate()
+        free_pool.terminate()
+        self.assertTrue(busy_pool._executor._shutdown)
+        self.assertTrue(free_pool._executor._shutdown)
+
 
 if __name__ == '__main__':
     unittest.main()